@@ -1,12 +1,97 @@
 import abc
-from typing import Optional, List, Dict, Any
+import asyncio
+import inspect
+import itertools
+import json
+import multiprocessing
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future, as_completed, wait, \
+    TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial, wraps
+from typing import Optional, List, Dict, Any, Callable, Iterator, Tuple
 
 from ovos_gguf_solver import GGUFSolver
 from ovos_utils.log import LOG
+from ovos_utils.xdg_utils import xdg_cache_home
 
 from ovos_plugin_manager.templates.language import LanguageTranslator, LanguageDetector
 from ovos_plugin_manager.templates.solvers import AbstractSolver, MultipleChoiceSolver, QuestionSolver
 
+from ovos_MoS.cache import ResponseCache, SemanticCache, SQLiteCache
+from ovos_MoS.utils import canonicalize, compile_template, dedup_answers, jaccard_similarity
+
+NO_ANSWER = "No answer could be gathered from workers."
+
+# solver owned by a dedicated worker process, see AbstractMoS.is_cpu_bound
+_PROCESS_SOLVER: Optional[QuestionSolver] = None
+
+
+def _init_process_solver(solver_class: type, config: Dict[str, Any]) -> None:
+    """Instantiate the solver once when the worker process starts."""
+    global _PROCESS_SOLVER
+    _PROCESS_SOLVER = solver_class(config)
+
+
+def _process_spoken_answer(query: str,
+                           lang: Optional[str] = None,
+                           units: Optional[str] = None) -> str:
+    """Answer a query with the solver of the current worker process."""
+    return _PROCESS_SOLVER.get_spoken_answer(query, lang=lang, units=units)
+
+
+@lru_cache(maxsize=None)
+def _rerank_accepts_top_k(reranker_class: type) -> bool:
+    """Check once per ReRanker class if its rerank method takes a "top_k" argument."""
+    try:
+        return "top_k" in inspect.signature(reranker_class.rerank).parameters
+    except (TypeError, ValueError):
+        # compiled or builtin callables may not expose a signature
+        return False
+
+
+def cached_answer(func: Callable[..., str]) -> Callable[..., str]:
+    """
+    Decorate a get_spoken_answer implementation so answers are served from the
+    persistent cache (same query) or the semantic cache (similar query) when enabled.
+    """
+
+    @wraps(func)
+    def wrapper(self: "AbstractMoS", query: str,
+                lang: Optional[str] = None,
+                units: Optional[str] = None) -> str:
+        if self._persistent_cache is None and self._semantic_cache is None:
+            return func(self, query, lang=lang, units=units)
+
+        key = None
+        if self._persistent_cache is not None:
+            key = ResponseCache.make_key(query=query, lang=lang, units=units,
+                                         solvers=self._solver_fingerprint())
+            answer = self._persistent_cache.get(key)
+            if answer is not None:
+                LOG.debug("persistent cache hit: %s", query)
+                return answer
+
+        scope = f"{lang}|{units}"
+        if self._semantic_cache is not None:
+            answer = self._semantic_cache.get(query, scope)
+            if answer is not None:
+                LOG.debug("semantic cache hit: %s", query)
+                return answer
+
+        answer = func(self, query, lang=lang, units=units)
+        if answer and answer != NO_ANSWER:
+            if key is not None:
+                self._persistent_cache.put(key, answer)
+            if self._semantic_cache is not None:
+                self._semantic_cache.put(query, answer, scope)
+        return answer
+
+    return wrapper
+
 
 class AbstractMoS(QuestionSolver):
     def __init__(self, workers: List[QuestionSolver],
@@ -35,6 +120,360 @@ class AbstractMoS(QuestionSolver):
                          enable_tx, enable_cache, internal_lang,
                          *args, **kwargs)
         self.workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # solver id -> call abandoned after a timeout that is still holding an executor thread
+        self._hung: Dict[int, Future] = {}
+        self._response_cache: Optional[ResponseCache] = None
+        if enable_cache:
+            self._response_cache = ResponseCache(max_size=self.config.get("cache_size", 1024),
+                                                 ttl=self.config.get("cache_ttl_secs", 3600))
+        self._fingerprint: Optional[str] = None
+        self._persistent_cache: Optional[SQLiteCache] = None
+        persistent_cfg = self.config.get("persistent_cache")
+        if enable_cache and persistent_cfg:
+            path = persistent_cfg if isinstance(persistent_cfg, str) else \
+                os.path.join(xdg_cache_home(), "ovos_MoS", "answers.db")
+            self._persistent_cache = SQLiteCache(path, ttl=self.config.get("cache_ttl_secs", 3600))
+        self._semantic_cache: Optional[SemanticCache] = None
+        semantic_cfg = self.config.get("semantic_cache")
+        if semantic_cfg:
+            if not isinstance(semantic_cfg, dict):
+                semantic_cfg = {}
+            try:
+                self._semantic_cache = SemanticCache(**semantic_cfg)
+            except ImportError as e:
+                LOG.error("semantic cache disabled, missing dependency: %s", e)
+        # CPU bound workers get a dedicated process each, so local models don't contend for the GIL
+        self._process_pools: Dict[int, ProcessPoolExecutor] = {}
+        self._process_lock = threading.Lock()
+        if self.config.get("process_workers", False):
+            for solver in self.workers:
+                if self.is_cpu_bound(solver) and id(solver) not in self._process_pools:
+                    self._process_pools[id(solver)] = self._new_process_pool(solver)
+
+    @staticmethod
+    def _new_process_pool(solver: QuestionSolver) -> ProcessPoolExecutor:
+        """
+        Create the dedicated process of a CPU bound worker, the solver is re-created there from its class and config.
+
+        Args:
+            solver (QuestionSolver): The worker to run in the process.
+
+        Returns:
+            ProcessPoolExecutor: Single process pool answering the queries of that worker.
+        """
+        return ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"),
+                                   initializer=_init_process_solver,
+                                   initargs=(type(solver), solver.config))
+
+    def _solver_fingerprint(self) -> str:
+        """
+        Identify this MoS setup, so persisted answers are only reused by an equivalent MoS.
+
+        Computed on first use, once subclasses assigned all their solvers, see invalidate_cache.
+
+        Returns:
+            str: sha256 of the MoS class, its config and the class and config of every solver it consults.
+        """
+        if self._fingerprint is not None:
+            return self._fingerprint
+        solvers = list(self.workers)
+        for role in ("king", "president"):
+            if getattr(self, role, None) is not None:
+                solvers.append(getattr(self, role))
+        for role in ("voters", "founders"):
+            solvers += getattr(self, role, None) or []
+        self._fingerprint = ResponseCache.make_key(
+            mos=f"{type(self).__module__}.{type(self).__name__}",
+            config=self.config,
+            solvers=sorted(json.dumps([f"{type(s).__module__}.{type(s).__name__}",
+                                       getattr(s, "config", None)], sort_keys=True, default=str)
+                           for s in solvers))
+        return self._fingerprint
+
+    def invalidate_cache(self) -> None:
+        """
+        Forget the in-memory cached answers and the solver fingerprint.
+
+        Must be called after changing the solvers or config at runtime. Persisted answers
+        are kept, they are keyed by the fingerprint of the setup that produced them.
+        """
+        self._fingerprint = None
+        if self._response_cache is not None:
+            self._response_cache.clear()
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
+
+    @staticmethod
+    def is_cpu_bound(solver: QuestionSolver) -> bool:
+        """
+        Check if a solver runs local inference, rather than waiting on network I/O.
+
+        Args:
+            solver (QuestionSolver): The solver to check.
+
+        Returns:
+            bool: True for GGUF solvers or solvers flagging themselves with a "cpu_bound" attribute.
+        """
+        return isinstance(solver, GGUFSolver) or getattr(solver, "cpu_bound", False)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Thread pool used to consult solvers in parallel, created on first use and reused for the MoS lifetime.
+
+        Created lazily so subclasses have assigned their voters/founders, the pool is sized
+        for the largest group of solvers consulted at once. With the "min_answers" config
+        workers and founders run at the same time, the pool fits both.
+
+        Returns:
+            ThreadPoolExecutor: The shared executor of this MoS instance.
+        """
+        if self._executor is None:
+            n_workers = len(self.workers)
+            n_founders = len(getattr(self, "founders", None) or [])
+            if self.config.get("min_answers"):
+                # founders start discussing while slow workers still hold their threads
+                n_founders += n_workers
+            max_workers = self.config.get("max_workers") or \
+                          max(n_workers,
+                              len(getattr(self, "voters", None) or []),
+                              n_founders,
+                              1)
+            self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                                thread_name_prefix=f"{type(self).__name__}-worker")
+        return self._executor
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        Release the threads and worker processes owned by this MoS.
+
+        Args:
+            wait (bool): Block until running solver calls finish.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+        for pool in self._process_pools.values():
+            pool.shutdown(wait=wait)
+        self._process_pools.clear()
+
+    def __del__(self):
+        # pools are owned by the instance, don't leave idle threads/processes behind once it is gone
+        try:
+            self.shutdown(wait=False)
+        except Exception:
+            pass
+
+    def _submit(self, solver: AbstractSolver, func: Callable[..., Any], *args, **kwargs) -> Optional[Future]:
+        """
+        Submit a call for a solver to the executor, unless a previous call to it timed out and is still running.
+
+        Args:
+            solver (AbstractSolver): The solver being consulted.
+            func (Callable[..., Any]): Function to run in the executor.
+            *args: Positional arguments for func.
+            **kwargs: Keyword arguments for func.
+
+        Returns:
+            Optional[Future]: The submitted call, None if the solver is still busy.
+        """
+        hung = self._hung.get(id(solver))
+        if hung is not None:
+            if not hung.done():
+                # resubmitting would pile up threads behind a hung solver and starve the healthy ones
+                LOG.warning("solver %s is still busy with a timed out call, skipping it", solver)
+                return None
+            self._hung.pop(id(solver), None)
+        return self.executor.submit(func, *args, **kwargs)
+
+    def _abandon(self, solver: AbstractSolver, future: Future, timeout: Optional[float]) -> None:
+        """
+        Drop a call that did not finish in time.
+
+        Calls that did not start yet are cancelled, running calls can not be interrupted, they are
+        remembered so the solver is not consulted again until they finish, see _submit.
+
+        Args:
+            solver (AbstractSolver): The solver being consulted.
+            future (Future): The late call.
+            timeout (Optional[float]): The timeout that expired, for logging.
+        """
+        LOG.warning("solver %s timed out after %s seconds, dropping it", solver, timeout)
+        if not future.cancel():
+            self._hung[id(solver)] = future
+
+    def _iter_parallel(self, solvers: List[AbstractSolver],
+                       func: Callable[[AbstractSolver], Any],
+                       timeout: Optional[float] = None) -> Iterator[Tuple[int, Any]]:
+        """
+        Call func(solver) for every solver concurrently, yielding results as they complete.
+
+        Calls that did not start yet are cancelled if the caller stops iterating early.
+
+        Args:
+            solvers (List[AbstractSolver]): Solvers to consult.
+            func (Callable[[AbstractSolver], Any]): Function applied to each solver.
+            timeout (Optional[float]): Seconds to wait for all solvers, late solvers are dropped. None waits forever.
+
+        Returns:
+            Iterator[Tuple[int, Any]]: (solver index, result) pairs, result is None for solvers that raised an exception.
+        """
+        futures: Dict[Future, int] = {}
+        for idx, solver in enumerate(solvers):
+            future = self._submit(solver, func, solver)
+            if future is not None:
+                futures[future] = idx
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                idx = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    LOG.error("Error from solver %s: %s", solvers[idx], e)
+                    result = None
+                yield idx, result
+        except FuturesTimeoutError:
+            for future, idx in futures.items():
+                if not future.done():
+                    self._abandon(solvers[idx], future, timeout)
+        finally:
+            # running calls can not be interrupted, they finish in the background and are ignored
+            for future in futures:
+                future.cancel()
+
+    def _run_parallel(self, solvers: List[AbstractSolver],
+                      func: Callable[[AbstractSolver], Any],
+                      timeout: Optional[float] = None) -> List[Any]:
+        """
+        Call func(solver) for every solver concurrently and wait for all of them.
+
+        Use _iter_parallel instead when results are needed as soon as they arrive.
+
+        Args:
+            solvers (List[AbstractSolver]): Solvers to consult.
+            func (Callable[[AbstractSolver], Any]): Function applied to each solver.
+            timeout (Optional[float]): Seconds to wait for all solvers, late solvers are dropped. None waits forever.
+
+        Returns:
+            List[Any]: Results in the same order as the solvers, None for solvers that raised an exception,
+                timed out or are still busy with a previous timed out call.
+        """
+        futures: Dict[Future, int] = {}
+        for idx, solver in enumerate(solvers):
+            future = self._submit(solver, func, solver)
+            if future is not None:
+                futures[future] = idx
+        done, not_done = wait(futures, timeout=timeout)
+        for future in not_done:
+            self._abandon(solvers[futures[future]], future, timeout)
+        results = [None] * len(solvers)
+        for future in done:
+            idx = futures[future]
+            error = future.exception()
+            if error is not None:
+                LOG.error("Error from solver %s: %s", solvers[idx], error)
+            else:
+                results[idx] = future.result()
+        return results
+
+    def _cached_call(self, func: Callable[[], Any], **key_parts) -> Any:
+        """
+        Return the cached result of func if caching is enabled, computing and storing it on a miss.
+
+        Args:
+            func (Callable[[], Any]): Function computing the value.
+            **key_parts: Values that uniquely identify the result.
+
+        Returns:
+            Any: The cached or freshly computed value.
+        """
+        if self._response_cache is None:
+            return func()
+        key = ResponseCache.make_key(**key_parts)
+        value = self._response_cache.get(key)
+        if value is None:
+            value = func()
+            if value:
+                self._response_cache.put(key, value)
+        return value
+
+    def ask_worker(self, solver: QuestionSolver, query: str,
+                   lang: Optional[str] = None,
+                   units: Optional[str] = None) -> str:
+        """
+        Consult a single worker, answers are cached per worker when enable_cache is set.
+
+        Args:
+            solver (QuestionSolver): The worker to consult.
+            query (str): The query text.
+            lang (Optional[str]): Optional language code. Defaults to None.
+            units (Optional[str]): Optional units for the query. Defaults to None.
+
+        Returns:
+            str: The worker answer.
+        """
+        if id(solver) in self._process_pools:
+            return self._cached_call(lambda: self._ask_process_worker(solver, query, lang=lang, units=units),
+                                     solver=id(solver), query=query, lang=lang, units=units)
+        return self._cached_call(lambda: solver.get_spoken_answer(query, lang=lang, units=units),
+                                 solver=id(solver), query=query, lang=lang, units=units)
+
+    def _ask_process_worker(self, solver: QuestionSolver, query: str,
+                            lang: Optional[str] = None,
+                            units: Optional[str] = None) -> str:
+        """
+        Consult a worker in its dedicated process.
+
+        If the process died (e.g. out of memory while loading the model) the pool is re-created
+        for the next queries and this query is answered by the in-process solver.
+
+        Args:
+            solver (QuestionSolver): The worker to consult.
+            query (str): The query text.
+            lang (Optional[str]): Optional language code. Defaults to None.
+            units (Optional[str]): Optional units for the query. Defaults to None.
+
+        Returns:
+            str: The worker answer.
+        """
+        pool = self._process_pools[id(solver)]
+        try:
+            return pool.submit(_process_spoken_answer, query, lang=lang, units=units).result()
+        except BrokenProcessPool:
+            LOG.error("process of solver %s died, restarting it and answering in-process", solver)
+            with self._process_lock:
+                # concurrent queries may have hit the same broken pool, only replace it once
+                if self._process_pools.get(id(solver)) is pool:
+                    pool.shutdown(wait=False)
+                    self._process_pools[id(solver)] = self._new_process_pool(solver)
+            return solver.get_spoken_answer(query, lang=lang, units=units)
+
+    @staticmethod
+    def select_best(reranker: MultipleChoiceSolver, query: str, answers: List[str],
+                    lang: Optional[str] = None) -> Optional[str]:
+        """
+        Use a ReRanker to pick the best answer, without consuming the remaining ranked results.
+
+        ReRankers accepting a "top_k" argument are only asked for the best result.
+
+        Args:
+            reranker (MultipleChoiceSolver): The ReRanker plugin.
+            query (str): The query text.
+            answers (List[str]): The candidate answers.
+            lang (Optional[str]): Optional language code. Defaults to None.
+
+        Returns:
+            Optional[str]: The top ranked answer, None if there were no candidates.
+        """
+        kwargs = {"lang": lang}
+        # rerankers that score everything before returning can stop at the first result
+        if _rerank_accepts_top_k(type(reranker)):
+            kwargs["top_k"] = 1
+        for score, ans in reranker.rerank(query, answers, **kwargs):
+            LOG.debug("ReRanker score: %s - %s", score, ans)
+            return ans
+        return None
 
     @abc.abstractmethod
     def get_spoken_answer(self, query: str,
@@ -59,6 +498,172 @@ class AbstractMoS(QuestionSolver):
         """
         Consult the QuestionSolver workers and gather their responses.
 
+        Args:
+            query (str): The query text.
+            lang (Optional[str]): Optional language code. Defaults to None.
+            units (Optional[str]): Optional units for the query. Defaults to None.
+
+        If the "early_exit" config is set, gathering stops as soon as "early_exit_agreement"
+        workers gave the same answer, the remaining workers are not waited for.
+
+        Returns:
+            List[str]: A list of responses from the workers.
+        """
+        early_exit = self.config.get("early_exit", False)
+        agreement = self.config.get("early_exit_agreement", 2)
+        results = [None] * len(self.workers)
+        count = Counter()
+        for idx, answer in self._iter_parallel(self.workers,
+                                               lambda solver: self.ask_worker(solver, query, lang=lang, units=units),
+                                               timeout=self.config.get("worker_timeout", 30)):
+            results[idx] = answer
+            if early_exit and answer:
+                count[canonicalize(answer)] += 1
+                if count[canonicalize(answer)] >= agreement:
+                    LOG.debug("%s workers agree, not waiting for the others", agreement)
+                    break
+        answers = [answer for answer in results if answer]
+        if not answers:
+            LOG.warning("No answers gathered from workers.")
+        return answers
+
+    def gather_first_responses(self, query: str, min_answers: int,
+                               lang: Optional[str] = None,
+                               units: Optional[str] = None,
+                               wait_for: Optional[List[QuestionSolver]] = None) -> List[str]:
+        """
+        Consult the QuestionSolver workers, returning as soon as min_answers of them answered.
+
+        Answers from the remaining workers are added to the returned list as they arrive,
+        consumers can pick them up later instead of waiting for the slowest worker upfront.
+        The list is always ordered like the workers. Workers still running after the
+        "worker_timeout" config are dropped.
+
+        Args:
+            query (str): The query text.
+            min_answers (int): Number of answers to wait for.
+            lang (Optional[str]): Optional language code. Defaults to None.
+            units (Optional[str]): Optional units for the query. Defaults to None.
+            wait_for (Optional[List[QuestionSolver]]): Workers that must be done before returning,
+                e.g. solvers the caller consults next, that must not be called from two threads at once.
+
+        Returns:
+            List[str]: A list of responses from the workers, that may keep growing.
+        """
+        answers: List[str] = []
+        results = [None] * len(self.workers)
+        ready = threading.Event()
+        lock = threading.Lock()
+        futures: Dict[Future, int] = {}
+        for idx, solver in enumerate(self.workers):
+            future = self._submit(solver, self.ask_worker, solver, query, lang=lang, units=units)
+            if future is not None:
+                futures[future] = idx
+        pending = len(futures)
+        wait_ids = {id(solver) for solver in wait_for or []}
+        required = sum(id(self.workers[idx]) in wait_ids for idx in futures.values())
+        timed_out = False
+        timer: Optional[threading.Timer] = None
+
+        def on_done(future: Future) -> None:
+            nonlocal pending, required
+            idx = futures[future]
+            if future.cancelled():
+                answer = None
+            else:
+                try:
+                    answer = future.result()
+                except Exception as e:
+                    LOG.error("Error from solver %s: %s", self.workers[idx], e)
+                    answer = None
+            with lock:
+                pending -= 1
+                if id(self.workers[idx]) in wait_ids:
+                    required -= 1
+                if answer and not timed_out:
+                    results[idx] = answer
+                    # replaced in place, consumers holding the list see the late answers
+                    answers[:] = [ans for ans in results if ans]
+                if (len(answers) >= min_answers and not required) or not pending:
+                    ready.set()
+                if not pending and timer is not None:
+                    timer.cancel()
+
+        def drop_late() -> None:
+            nonlocal timed_out
+            with lock:
+                timed_out = True
+            for future, idx in futures.items():
+                if not future.done():
+                    self._abandon(self.workers[idx], future, timeout)
+
+        if not futures:
+            ready.set()
+        for future in futures:
+            future.add_done_callback(on_done)
+        timeout = self.config.get("worker_timeout", 30)
+        start = time.monotonic()
+        if not ready.wait(timeout=timeout):
+            drop_late()
+        else:
+            with lock:
+                if pending:
+                    # keep collecting late answers in the background until the timeout expires
+                    timer = threading.Timer(max(timeout - (time.monotonic() - start), 0), drop_late)
+                    timer.daemon = True
+                    timer.start()
+        if not answers:
+            LOG.warning("No answers gathered from workers.")
+        return answers
+
+    def get_spoken_answer_batch(self, queries: List[str],
+                                lang: Optional[str] = None,
+                                units: Optional[str] = None) -> List[str]:
+        """
+        Obtain the spoken answers for a list of queries.
+
+        Every query already consults the solvers in parallel, so queries are answered one after the other.
+
+        Args:
+            queries (List[str]): The query texts.
+            lang (Optional[str]): Optional language code. Defaults to None.
+            units (Optional[str]): Optional units for the queries. Defaults to None.
+
+        Returns:
+            List[str]: The spoken answers, in the same order as the queries.
+        """
+        return [self.get_spoken_answer(query, lang=lang, units=units) for query in queries]
+
+    async def aget_spoken_answer(self, query: str,
+                                 lang: Optional[str] = None,
+                                 units: Optional[str] = None) -> str:
+        """
+        Obtain the spoken answer for a given query without blocking the event loop.
+
+        Args:
+            query (str): The query text.
+            lang (Optional[str]): Optional language code. Defaults to None.
+            units (Optional[str]): Optional units for the query. Defaults to None.
+
+        Returns:
+            str: The spoken answer as a text response.
+        """
+        # NOTE: runs in the loop default executor, not self.executor,
+        # get_spoken_answer itself submits work to self.executor and waits on it
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.get_spoken_answer, query,
+                                                        lang=lang, units=units))
+
+    async def agather_responses(self, query: str,
+                                lang: Optional[str] = None,
+                                units: Optional[str] = None) -> List[str]:
+        """
+        Consult the QuestionSolver workers concurrently and gather their responses.
+
+        Workers providing an async aget_spoken_answer method are awaited directly,
+        blocking workers are run in the executor. Workers slower than the "worker_timeout"
+        config are dropped, a slow worker can not hold the others back.
+
         Args:
             query (str): The query text.
             lang (Optional[str]): Optional language code. Defaults to None.
@@ -67,19 +672,79 @@ class AbstractMoS(QuestionSolver):
         Returns:
             List[str]: A list of responses from the workers.
         """
+        loop = asyncio.get_running_loop()
+
+        async def ask(solver: QuestionSolver) -> str:
+            if asyncio.iscoroutinefunction(getattr(solver, "aget_spoken_answer", None)):
+                key = ResponseCache.make_key(solver=id(solver), query=query, lang=lang, units=units)
+                answer = self._response_cache.get(key) if self._response_cache is not None else None
+                if answer is None:
+                    answer = await solver.aget_spoken_answer(query, lang=lang, units=units)
+                    if answer and self._response_cache is not None:
+                        self._response_cache.put(key, answer)
+                return answer
+            return await loop.run_in_executor(self.executor, partial(self.ask_worker, solver, query,
+                                                                     lang=lang, units=units))
+
+        timeout = self.config.get("worker_timeout", 30)
+        results = await asyncio.gather(*[asyncio.wait_for(ask(solver), timeout=timeout)
+                                         for solver in self.workers],
+                                       return_exceptions=True)
         answers = []
-        for solver in self.workers:
-            try:
-                answer = solver.get_spoken_answer(query, lang=lang, units=units)
-                if answer:
-                    answers.append(answer)
-            except Exception as e:
-                LOG.error(f"Error from solver {solver}: {e}")
+        for solver, answer in zip(self.workers, results):
+            if isinstance(answer, asyncio.TimeoutError):
+                LOG.warning("solver %s timed out after %s seconds, dropping it", solver, timeout)
+            elif isinstance(answer, Exception):
+                LOG.error("Error from solver %s: %s", solver, answer)
+            elif answer:
+                answers.append(answer)
         if not answers:
             LOG.warning("No answers gathered from workers.")
         return answers
 
 
+class PersonaSolver(QuestionSolver):
+    def __init__(self, solver: QuestionSolver, persona: str) -> None:
+        """
+        Thin proxy giving a role to a shared solver, several personas can share one loaded model.
+
+        Args:
+            solver (QuestionSolver): The solver answering the queries.
+            persona (str): Instructions prepended to every query.
+        """
+        super().__init__({"persona": persona})
+        self.solver = solver
+        self.persona = persona
+
+    def format_prompt(self, query: str) -> str:
+        """
+        Prepend the persona to a query.
+
+        Args:
+            query (str): The query text.
+
+        Returns:
+            str: The query for the underlying solver.
+        """
+        return f"{self.persona}\n\n{query}"
+
+    def get_spoken_answer(self, query: str,
+                          lang: Optional[str] = None,
+                          units: Optional[str] = None) -> str:
+        """
+        Obtain the spoken answer of the underlying solver, in character.
+
+        Args:
+            query (str): The query text.
+            lang (Optional[str]): Optional language code. Defaults to None.
+            units (Optional[str]): Optional units for the query. Defaults to None.
+
+        Returns:
+            str: The spoken answer as a text response.
+        """
+        return self.solver.get_spoken_answer(self.format_prompt(query), lang=lang, units=units)
+
+
 class AbstractKingMoS(AbstractMoS):
     def __init__(self, king: AbstractSolver,
                  workers: List[QuestionSolver],
@@ -155,13 +820,34 @@ class AbstractDuopolyMoS(AbstractMoS):
             enable_cache (bool): Flag to enable caching.
             internal_lang (Optional[str]): Internal language code. Defaults to None.
         """
-        workers = workers or self.founders
+        workers = workers or founders
         super().__init__(workers, config, translator, detector, priority,
                          enable_tx, enable_cache, internal_lang,
                          *args, **kwargs)
+        personas = self.config.get("founder_personas")
+        if personas:
+            # role differentiated founders sharing the loaded models instead of one model per founder
+            founders = [PersonaSolver(founders[idx % len(founders)], persona)
+                        for idx, persona in enumerate(personas)]
         self.founders = founders
         self.president = president
+        self.discussion_rounds = int(self.config.get("max_discussion_rounds",
+                                                     self.config.get("discussion_rounds", 3)))
+        self.min_discussion_rounds = int(self.config.get("min_discussion_rounds", 1))
+        self.converge_threshold = float(self.config.get("converge_threshold", 0.85))
+        self.discuss_prompt = self.config.get("discuss_prompt",
+                                              "given a natural language query and potential answers, your task is to discuss the responses, improving them and correcting any flaws")
+        self.system = self.config.get("system_prompt",
+                                      "given a natural language query and a discussion about it, your task is to generate a final answer, it needs to be short, factual and conversational")
+        self.prompt = self.config.get("prompt_template",
+                                      "{system}\nquery: {query}\n\nresponses:{ans}\n\ndiscussion:{discussion}")
+        # the discussion grows every round, keeping it at the end of the template means every
+        # founder prompt extends the previous one and LLM backends can reuse the cached prefix
+        if not self.prompt.rstrip().endswith("{discussion}"):
+            LOG.warning("prompt_template should end with '{discussion}', "
+                        "otherwise the prompt prefix can not be reused across discussion rounds")
 
+    @cached_answer
     def get_spoken_answer(self, query: str,
                           lang: Optional[str] = None,
                           units: Optional[str] = None) -> str:
@@ -176,13 +862,133 @@ class AbstractDuopolyMoS(AbstractMoS):
         Returns:
             str: The spoken answer as a text response.
         """
-        answers = self.gather_responses(query, lang=lang, units=units)
+        min_answers = self.config.get("min_answers")
+        if min_answers:
+            # start discussing before the slowest workers are done, late answers join the next rounds.
+            # founders that are also workers must finish first, a solver is never called concurrently
+            founders = [f.solver if isinstance(f, PersonaSolver) else f for f in self.founders]
+            answers = self.gather_first_responses(query, min_answers, lang=lang, units=units,
+                                                  wait_for=founders)
+        else:
+            answers = self.gather_responses(query, lang=lang, units=units)
         if not answers:
-            return "No answer could be gathered from workers."
-
-        final_answer = self.discuss_answers(query, answers, lang=lang, units=units)
+            return NO_ANSWER
+        # a lone answer is not an agreement, it still needs the discussion
+        if self.config.get("short_circuit_unanimous", True) and len(answers) > 1 and \
+                (not min_answers or len(answers) == len(self.workers)) and \
+                len(dedup_answers(answers)) == 1:
+            LOG.debug("workers are unanimous, skipping discussion")
+            return answers[0]
+
+        final_answer = self._cached_call(lambda: self.discuss_answers(query, answers, lang=lang, units=units),
+                                         stage="discuss", query=query, answers=list(answers),
+                                         lang=lang, units=units)
         return final_answer
 
+    def ask_founders(self, prompt: str,
+                     lang: Optional[str] = None,
+                     units: Optional[str] = None) -> List[Optional[str]]:
+        """
+        Ask every founder to reply to the same prompt.
+
+        Distinct founders are consulted in parallel. A solver instance seated as several founders,
+        directly or behind PersonaSolver proxies, gets all of its prompts in one
+        get_spoken_answer_batch call when it provides one, otherwise it answers them one after the other.
+
+        Args:
+            prompt (str): The prompt sent to the founders.
+            lang (Optional[str]): Optional language code. Defaults to None.
+            units (Optional[str]): Optional units for the query. Defaults to None.
+
+        Returns:
+            List[Optional[str]]: The reply of each founder, None for founders that failed.
+        """
+        # underlying solver -> [(founder index, prompt for that founder)]
+        seats: Dict[int, List[Tuple[int, str]]] = {}
+        solvers: List[QuestionSolver] = []
+        for idx, founder in enumerate(self.founders):
+            solver, seat_prompt = founder, prompt
+            if isinstance(founder, PersonaSolver):
+                solver, seat_prompt = founder.solver, founder.format_prompt(prompt)
+            if id(solver) not in seats:
+                seats[id(solver)] = []
+                solvers.append(solver)
+            seats[id(solver)].append((idx, seat_prompt))
+
+        def ask(solver: QuestionSolver) -> List[str]:
+            prompts = [seat_prompt for _, seat_prompt in seats[id(solver)]]
+            if len(prompts) > 1 and hasattr(solver, "get_spoken_answer_batch"):
+                return solver.get_spoken_answer_batch(prompts, lang=lang, units=units)
+            return [solver.get_spoken_answer(p, lang=lang, units=units) for p in prompts]
+
+        replies = [None] * len(self.founders)
+        for solver, answers in zip(solvers, self._run_parallel(solvers, ask)):
+            for (idx, _), ans in zip(seats[id(solver)], answers or []):
+                replies[idx] = ans
+        return replies
+
+    def hold_discussion(self, query: str, answers: List[str],
+                        lang: Optional[str] = None,
+                        units: Optional[str] = None) -> List[str]:
+        """
+        Run the discussion rounds, every founder comments on the answers and the discussion so far.
+
+        Uses the "discuss_prompt" and "prompt_template" of the subclass.
+
+        Args:
+            query (str): The query text.
+            answers (List[str]): The list of answers to discuss, answers appended to it
+                while the discussion is ongoing are included from the next round.
+            lang (Optional[str]): Optional language code. Defaults to None.
+            units (Optional[str]): Optional units for the query. Defaults to None.
+
+        Returns:
+            List[str]: The founder contributions, in order.
+        """
+        # answers are gathered once by get_spoken_answer, never re-gather them here
+        assert answers, "discuss_answers called with empty answers"
+        # everything but the discussion is invariant across rounds, format it once.
+        # the discussion is appended at the end so every prompt sent to a founder
+        # extends the previous one, letting LLM backends reuse the cached prefix
+        seen = list(answers)
+        render = compile_template(self.prompt, system=self.discuss_prompt, query=query, ans='\n-'.join(seen))
+        discussion = []
+        # '\n-'.join(discussion), maintained incrementally instead of re-joined every round
+        discussion_str = ""
+        for i in range(self.discussion_rounds):
+            if answers != seen:
+                # late worker answers arrived (see gather_first_responses), include them from now on
+                seen = list(answers)
+                render = compile_template(self.prompt, system=self.discuss_prompt, query=query,
+                                          ans='\n-'.join(seen))
+            # founders in the same round answer the same prompt, ask them all at once
+            prompt = render(discussion=discussion_str)
+            replies = self.ask_founders(prompt, lang=lang, units=units)
+            for founder, ans in zip(self.founders, replies):
+                LOG.debug("founder %s says: %s", founder, ans)
+                if ans:
+                    discussion.append(ans)
+                    discussion_str += "\n-" + ans if discussion_str else ans
+            if i + 1 >= self.min_discussion_rounds and self.founders_converged([r for r in replies if r]):
+                LOG.debug("founders converged after %s rounds", i + 1)
+                break
+        return discussion
+
+    def founders_converged(self, replies: List[str]) -> bool:
+        """
+        Check if the founders replies in a round agree, making further rounds unnecessary.
+
+        Args:
+            replies (List[str]): The replies of a discussion round.
+
+        Returns:
+            bool: True if every pair of replies overlaps more than the "converge_threshold" config.
+        """
+        if len(replies) < 2:
+            return False
+        return min(jaccard_similarity(a, b)
+                   for a, b in itertools.combinations(replies, 2)) > self.converge_threshold
+
     @abc.abstractmethod
     def discuss_answers(self, query: str, answers: List[str],
                         lang: Optional[str] = None,
@@ -234,6 +1040,7 @@ class DemocracyMoS(AbstractMoS):
                          *args, **kwargs)
         self.voters = voters
 
+    @cached_answer
     def get_spoken_answer(self, query: str,
                           lang: Optional[str] = None,
                           units: Optional[str] = None) -> str:
@@ -250,20 +1057,42 @@ class DemocracyMoS(AbstractMoS):
         """
         answers = self.gather_responses(query, lang=lang, units=units)
         if not answers:
-            return "No answer could be gathered from workers."
-        final_answer = self.vote_on_answers(query, answers, lang=lang)
+            return NO_ANSWER
+        final_answer = self._cached_call(lambda: self.vote_on_answers(query, answers, lang=lang),
+                                         stage="vote", query=query, answers=answers, lang=lang)
         return final_answer
 
     def gather_votes(self, query: str, answers: List[str],
-                     lang: Optional[str] = None) -> Dict[str, int]:
-        count = {}
-        for voter in self.voters:
-            ans = voter.select_answer(query, answers, lang=lang)
-            if ans not in count:
-                count[ans] = 1
-            else:
+                     lang: Optional[str] = None,
+                     early_exit: bool = False) -> Counter:
+        """
+        Ask every voter to select the best answer and count the votes.
+
+        Args:
+            query (str): The query text.
+            answers (List[str]): The list of answers to vote on
+            lang (Optional[str]): Optional language code. Defaults to None.
+            early_exit (bool): Stop waiting for voters once the remaining votes can not change the winner.
+
+        Returns:
+            Counter: Number of votes per voted answer.
+        """
+        votes = [None] * len(self.voters)
+        count = Counter()
+        remaining = len(self.voters)
+        for idx, ans in self._iter_parallel(self.voters,
+                                            lambda voter: voter.select_answer(query, answers, lang=lang)):
+            remaining -= 1
+            votes[idx] = ans
+            if early_exit and ans is not None:
                 count[ans] += 1
-        return count
+                lead, second = ([n for _, n in count.most_common(2)] + [0])[:2]
+                if lead > second + remaining:
+                    LOG.debug("winner decided, skipping %s voters", remaining)
+                    break
+
+        # count in voter order so ties are resolved deterministically
+        return Counter(ans for ans in votes if ans is not None)
 
     def vote_on_answers(self, query: str, answers: List[str],
                         lang: Optional[str] = None) -> str:
@@ -279,8 +1108,14 @@ class DemocracyMoS(AbstractMoS):
         Returns:
             str: The refined answer after discussion.
         """
-        count = self.gather_votes(query, answers, lang=lang)
-        return max(count, key=lambda k: count[k])
+        answers = dedup_answers(answers)
+        if len(answers) == 1:
+            return answers[0]
+        count = self.gather_votes(query, answers, lang=lang, early_exit=True)
+        if not count:
+            LOG.warning("No votes gathered from voters.")
+            return answers[0]
+        return count.most_common(1)[0][0]
 
 
 ##########################
@@ -315,6 +1150,7 @@ class ReRankerKingMoS(AbstractKingMoS):
                          enable_tx, enable_cache, internal_lang,
                          *args, **kwargs)
 
+    @cached_answer
     def get_spoken_answer(self, query: str,
                           lang: Optional[str] = None,
                           units: Optional[str] = None) -> str:
@@ -329,14 +1165,11 @@ class ReRankerKingMoS(AbstractKingMoS):
         Returns:
             str: The spoken answer as a text response.
         """
-        answers = self.gather_responses(query, lang=lang, units=units)
-        best = None
+        answers = dedup_answers(self.gather_responses(query, lang=lang, units=units))
+        if len(answers) == 1:
+            return answers[0]
         assert isinstance(self.king, MultipleChoiceSolver)
-        for score, ans in self.king.rerank(query, answers, lang=lang):
-            LOG.debug(f"ReRanker score: {score} - {ans}")
-            if not best:
-                best = ans
-        return best
+        return self.select_best(self.king, query, answers, lang=lang)
 
 
 class ReRankerDemocracyMoS(DemocracyMoS):
@@ -384,13 +1217,13 @@ class ReRankerDemocracyMoS(DemocracyMoS):
         Returns:
             str: The refined answer after discussion.
         """
-        ans = list(set(self.gather_votes(query, answers, lang=lang)))
-        best = None
-        for score, ans in self.president.rerank(query, list(set(ans)), lang=lang):
-            LOG.debug(f"ReRanker score: {score} - {ans}")
-            if not best:
-                best = ans
-        return best
+        answers = dedup_answers(answers)
+        if len(answers) == 1:
+            return answers[0]
+        candidates = dedup_answers(self.gather_votes(query, answers, lang=lang))
+        if len(candidates) == 1:
+            return candidates[0]
+        return self.select_best(self.president, query, candidates, lang=lang)
 
 
 class ReRankerDuopolyMoS(AbstractDuopolyMoS):
@@ -424,12 +1257,6 @@ class ReRankerDuopolyMoS(AbstractDuopolyMoS):
         super().__init__(president, founders, workers, config, translator, detector, priority,
                          enable_tx, enable_cache, internal_lang,
                          *args, **kwargs)
-        self.discuss_prompt = self.config.get("discuss_prompt",
-                                              "given a natural language query and potential answers, your task is to discuss the responses, improving them and correcting any flaws")
-        self.system = self.config.get("system_prompt",
-                                      "given a natural language query and a discussion about it, your task is to generate a final answer, it needs to be short, factual and conversational")
-        self.prompt = self.config.get("prompt_template",
-                                      "{system}\nquery: {query}\n\nresponses:{ans}\n\ndiscussion:{discussion}")
 
     def discuss_answers(self, query: str, answers: List[str],
                         lang: Optional[str] = None,
@@ -446,29 +1273,19 @@ class ReRankerDuopolyMoS(AbstractDuopolyMoS):
         Returns:
             str: The refined answer after discussion.
         """
-        answers = self.gather_responses(query, lang=lang, units=units)
-        # discuss
-        discussion = []
-        for i in range(self.config.get("discussion_rounds", 3)):
-            for founder in self.founders:
-                assert isinstance(founder, QuestionSolver)
-                prompt = self.prompt.format(system=self.discuss_prompt, query=query,
-                                            ans='\n-'.join(answers),
-                                            discussion='\n-'.join(discussion))
-                ans = founder.get_spoken_answer(prompt, lang=lang, units=units)
-                LOG.debug(f"founder {founder} says: {ans}")
-                discussion.append(ans)
+        discussion = self.hold_discussion(query, answers, lang=lang, units=units)
 
-        # select final answer
+        # generate final answer candidates
         prompt = f"{self.system}\n\nDiscussion:\n" + "\n".join(discussion)
-        # generate final answer
-        answers = []
-        for founder in self.founders:
-            assert isinstance(founder, QuestionSolver)
-            ans = founder.get_spoken_answer(prompt, lang=lang, units=units)
-            answers.append(ans)
-            LOG.debug(f"founder {founder} says: {ans}")
-        return self.president.select_answer(query, lang=lang)
+        final_answers = self.ask_founders(prompt, lang=lang, units=units)
+        for founder, ans in zip(self.founders, final_answers):
+            LOG.debug("founder %s says: %s", founder, ans)
+
+        # select final answer
+        candidates = dedup_answers(ans for ans in final_answers if ans) or dedup_answers(answers)
+        if len(candidates) == 1:
+            return candidates[0]
+        return self.president.select_answer(query, candidates, lang=lang)
 
 
 ##########################
@@ -504,7 +1321,10 @@ class GenerativeKingMoS(AbstractKingMoS):
         self.system = self.config.get("system_prompt",
                                       "given a natural language query and search results, your task is to write a short and factual conversational response to the query")
         self.prompt = self.config.get("prompt_template", "{system}\nquery: {query}\n\nsearch results:{ans}")
+        # system prompt is fixed, only query and answers change per request
+        self._render_prompt = compile_template(self.prompt, system=self.system)
 
+    @cached_answer
     def get_spoken_answer(self, query: str,
                           lang: Optional[str] = None,
                           units: Optional[str] = None) -> Optional[str]:
@@ -521,7 +1341,7 @@ class GenerativeKingMoS(AbstractKingMoS):
         """
         answers = self.gather_responses(query, lang=lang, units=units)
         assert isinstance(self.king, QuestionSolver)
-        prompt = self.prompt.format(system=self.system, query=query, ans='\n-'.join(answers))
+        prompt = self._render_prompt(query=query, ans='\n-'.join(answers))
         return self.king.get_spoken_answer(prompt, lang=lang, units=units)
 
 
@@ -556,12 +1376,6 @@ class GenerativeDuopolyMoS(AbstractDuopolyMoS):
         super().__init__(president, founders, workers, config, translator, detector, priority,
                          enable_tx, enable_cache, internal_lang,
                          *args, **kwargs)
-        self.discuss_prompt = self.config.get("discuss_prompt",
-                                              "given a natural language query and potential answers, your task is to discuss the responses, improving them and correcting any flaws")
-        self.system = self.config.get("system_prompt",
-                                      "given a natural language query and a discussion about it, your task is to generate a final answer, it needs to be short, factual and conversational")
-        self.prompt = self.config.get("prompt_template",
-                                      "{system}\nquery: {query}\n\nresponses:{ans}\n\ndiscussion:{discussion}")
 
     def discuss_answers(self, query: str, answers: List[str],
                         lang: Optional[str] = None,
@@ -578,18 +1392,7 @@ class GenerativeDuopolyMoS(AbstractDuopolyMoS):
         Returns:
             str: The refined answer after discussion.
         """
-        answers = self.gather_responses(query, lang=lang, units=units)
-        # discuss
-        discussion = []
-        for i in range(self.config.get("discussion_rounds", 3)):
-            for founder in self.founders:
-                assert isinstance(founder, QuestionSolver)
-                prompt = self.prompt.format(system=self.discuss_prompt, query=query,
-                                            ans='\n-'.join(answers),
-                                            discussion='\n-'.join(discussion))
-                ans = founder.get_spoken_answer(prompt, lang=lang, units=units)
-                LOG.debug(f"founder {founder} says: {ans}")
-                discussion.append(ans)
+        discussion = self.hold_discussion(query, answers, lang=lang, units=units)
 
         # select final answer
         prompt = f"{self.system}\n\nDiscussion:\n" + "\n".join(discussion)
@@ -629,6 +1432,8 @@ class GenerativeDemocracyMoS(DemocracyMoS):
         self.system = self.config.get("system_prompt",
                                       "given a natural language query and search results, your task is to write a short and factual conversational response to the query")
         self.prompt = self.config.get("prompt_template", "{system}\nquery: {query}\n\nsearch results:{ans}")
+        # system prompt is fixed, only query and answers change per request
+        self._render_prompt = compile_template(self.prompt, system=self.system)
 
     def vote_on_answers(self, query: str, answers: List[str],
                         lang: Optional[str] = None) -> str:
@@ -643,6 +1448,9 @@ class GenerativeDemocracyMoS(DemocracyMoS):
         Returns:
             str: The refined answer after discussion.
         """
-        ans = list(set(self.gather_votes(query, answers, lang=lang)))
-        prompt = self.prompt.format(system=self.system, query=query, ans='\n-'.join(ans))
+        answers = dedup_answers(answers)
+        if len(answers) == 1:
+            return answers[0]
+        candidates = dedup_answers(self.gather_votes(query, answers, lang=lang))
+        prompt = self._render_prompt(query=query, ans='\n-'.join(candidates))
         return self.president.get_spoken_answer(prompt, lang=lang)
@@ -0,0 +1,263 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from typing import Optional, Any, Tuple, Dict, List
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ovos_MoS.utils import canonicalize
+
+
+class ResponseCache:
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = 3600) -> None:
+        """
+        Thread safe in-memory LRU cache with optional expiration.
+
+        Args:
+            max_size (int): Maximum number of entries, least recently used entries are evicted first.
+            ttl (Optional[float]): Seconds an entry remains valid, None to never expire.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def make_key(**kwargs) -> str:
+        """
+        Build a stable cache key from keyword arguments.
+
+        Returns:
+            str: sha256 hex digest of the canonical JSON of the arguments.
+        """
+        data = json.dumps(kwargs, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Retrieve a cached value.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Any]: The cached value, None if missing or expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at and expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The value to cache.
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache:
+    def __init__(self, path: str, ttl: Optional[float] = 3600) -> None:
+        """
+        Thread safe persistent cache backed by a SQLite database, survives restarts.
+
+        Args:
+            path (str): Path of the database file, parent directories are created if needed.
+            ttl (Optional[float]): Seconds an entry remains valid, None to never expire.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS answer_cache ("
+                               "key TEXT PRIMARY KEY, value TEXT, expires_at REAL, hits INTEGER DEFAULT 0)")
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Retrieve a cached value.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[str]: The cached value, None if missing or expired.
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT value, expires_at FROM answer_cache WHERE key = ?",
+                                     (key,)).fetchone()
+            if row is not None and row[1] and row[1] < time.time():
+                self._conn.execute("DELETE FROM answer_cache WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute("UPDATE answer_cache SET hits = hits + 1 WHERE key = ?", (key,))
+            return row[0]
+
+    def put(self, key: str, value: str) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key (str): The cache key.
+            value (str): The value to cache.
+        """
+        # wall clock, unlike the in-memory caches entries must stay valid across restarts
+        expires_at = time.time() + self.ttl if self.ttl else 0
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO answer_cache (key, value, expires_at, hits) "
+                               "VALUES (?, ?, ?, 0)", (key, value, expires_at))
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM answer_cache")
+
+
+class SemanticCache:
+    def __init__(self, model: str = "all-MiniLM-L6-v2",
+                 threshold: float = 0.92,
+                 max_size: int = 1024,
+                 ttl: Optional[float] = 3600,
+                 embeddings_cache_size: int = 10000) -> None:
+        """
+        In-memory cache of answers, looked up by embedding similarity of the query.
+
+        Requires numpy and sentence-transformers.
+
+        Args:
+            model (str): sentence-transformers model used to embed queries.
+            threshold (float): Minimum cosine similarity for a cached query to be considered a match.
+            max_size (int): Maximum number of entries per scope, oldest entries are evicted first.
+            ttl (Optional[float]): Seconds an entry remains valid, None to never expire.
+            embeddings_cache_size (int): Number of computed embeddings memoized per text.
+        """
+        if np is None:
+            raise ImportError("SemanticCache requires numpy, pip install numpy")
+        from sentence_transformers import SentenceTransformer
+        self.encoder = SentenceTransformer(model)
+        self.threshold = threshold
+        self.max_size = max_size
+        self.ttl = ttl
+        # scope -> (L2 normalized embeddings matrix, answers, expiration timestamps)
+        self._entries: Dict[str, Tuple["np.ndarray", List[str], List[float]]] = {}
+        self._lock = Lock()
+        # recurring texts (retried queries, short factoid answers) are only embedded once
+        self._embed = lru_cache(maxsize=embeddings_cache_size)(self._encode)
+
+    def _encode(self, text: str) -> "np.ndarray":
+        vector = np.asarray(self.encoder.encode([text], normalize_embeddings=True)[0], dtype=np.float32)
+        vector.setflags(write=False)  # shared by every caller of the memoized embedding
+        return vector
+
+    def embed(self, text: str) -> "np.ndarray":
+        """
+        Embed a text into a L2 normalized float32 vector, so cosine similarity is a dot product.
+
+        Args:
+            text (str): The text to embed.
+
+        Returns:
+            np.ndarray: The normalized embedding, read only.
+        """
+        return self._embed(canonicalize(text))
+
+    def get(self, query: str, scope: str = "") -> Optional[str]:
+        """
+        Retrieve the answer of the most similar cached query.
+
+        Args:
+            query (str): The query text.
+            scope (str): Only entries stored under the same scope (e.g. language) are considered.
+
+        Returns:
+            Optional[str]: The cached answer, None if no cached query is similar enough.
+        """
+        with self._lock:
+            if scope not in self._entries:
+                return None
+        vector = self.embed(query)
+        with self._lock:
+            self._expire(scope)
+            if scope not in self._entries:
+                return None
+            matrix, answers, _ = self._entries[scope]
+            scores = matrix @ vector
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+            return answers[best]
+
+    def put(self, query: str, answer: str, scope: str = "") -> None:
+        """
+        Store the answer for a query.
+
+        Args:
+            query (str): The query text.
+            answer (str): The answer to cache.
+            scope (str): Scope the entry belongs to (e.g. language).
+        """
+        vector = self.embed(query)
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0
+        with self._lock:
+            if scope in self._entries:
+                matrix, answers, expirations = self._entries[scope]
+                matrix = np.vstack([matrix, vector])[-self.max_size:]
+                answers = (answers + [answer])[-self.max_size:]
+                expirations = (expirations + [expires_at])[-self.max_size:]
+            else:
+                matrix, answers, expirations = vector[np.newaxis, :], [answer], [expires_at]
+            self._entries[scope] = (matrix, answers, expirations)
+
+    def _expire(self, scope: str) -> None:
+        """Drop expired entries of a scope, must be called with the lock held."""
+        matrix, answers, expirations = self._entries[scope]
+        now = time.monotonic()
+        keep = [idx for idx, expires_at in enumerate(expirations)
+                if not expires_at or expires_at >= now]
+        if not keep:
+            self._entries.pop(scope)
+        elif len(keep) < len(expirations):
+            self._entries[scope] = (matrix[keep],
+                                    [answers[idx] for idx in keep],
+                                    [expirations[idx] for idx in keep])
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,77 @@
+import re
+import string
+import unicodedata
+from typing import Callable, Iterable, List
+
+
+def canonicalize(text: str) -> str:
+    """
+    Normalize a text so trivially different answers compare equal.
+
+    Args:
+        text (str): The text to normalize.
+
+    Returns:
+        str: NFKC normalized, stripped and lower cased text.
+    """
+    return unicodedata.normalize("NFKC", text).strip().lower()
+
+
+def dedup_answers(answers: Iterable[str]) -> List[str]:
+    """
+    Remove duplicate answers, keeping the first occurrence and the original order.
+
+    Args:
+        answers (Iterable[str]): The answers to deduplicate.
+
+    Returns:
+        List[str]: The unique answers.
+    """
+    seen = {}
+    for ans in answers:
+        seen.setdefault(canonicalize(ans), ans)
+    return list(seen.values())
+
+
+def jaccard_similarity(a: str, b: str) -> float:
+    """
+    Token set overlap between two texts.
+
+    Args:
+        a (str): First text.
+        b (str): Second text.
+
+    Returns:
+        float: Jaccard index of the canonical word sets, between 0 and 1.
+    """
+    tokens_a = set(canonicalize(a).split())
+    tokens_b = set(canonicalize(b).split())
+    return len(tokens_a & tokens_b) / max(len(tokens_a | tokens_b), 1)
+
+
+def compile_template(template: str, **constants: str) -> Callable[..., str]:
+    """
+    Pre-format a str.format template, so rendering it is a plain string concatenation.
+
+    Args:
+        template (str): The template, e.g. "{system}\\nquery: {query}".
+        **constants (str): Field values that never change, formatted once.
+
+    Returns:
+        Callable[..., str]: Renders the template given the remaining fields as keyword arguments.
+    """
+    parsed = [(name, spec, conv) for _, name, spec, conv in string.Formatter().parse(template)
+              if name is not None and name not in constants]
+    fields = [name for name, _, _ in parsed]
+    if not fields or len(set(fields)) != len(fields) or \
+            any(spec or conv or not name.isidentifier() for name, spec, conv in parsed):
+        # nothing to pre-split, or repeated/complex fields, let str.format handle it
+        return lambda **values: template.format(**constants, **values)
+    marked = template.format(**constants, **{f: f"\0{f}\0" for f in fields})
+    parts = re.split("\0(" + "|".join(fields) + ")\0", marked)
+
+    def render(**values: str) -> str:
+        # parts alternate between literal text and field names
+        return "".join(part if idx % 2 == 0 else values[part] for idx, part in enumerate(parts))
+
+    return render